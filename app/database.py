@@ -2,7 +2,7 @@ from pymongo import MongoClient, ASCENDING, DESCENDING
 from pymongo.errors import ConnectionFailure, OperationFailure
 import logging
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -31,10 +31,35 @@ if client:
         tasks_collection.create_index([("priority", ASCENDING)])
         tasks_collection.create_index([("status", ASCENDING)])
         tasks_collection.create_index([("created_at", DESCENDING)])
+        # Equality on completed, range on date: serves the reminder look-ahead query
+        tasks_collection.create_index([("completed", ASCENDING), ("date", ASCENDING)])
         logger.info("Database indexes created successfully")
     except OperationFailure as e:
         logger.warning(f"Failed to create indexes: {e}")
 
+# Callbacks invoked after task writes as listener(event, task_id, data),
+# where event is "create", "update" or "delete"
+TaskListener = Callable[[str, str, Dict[str, Any]], None]
+_task_listeners: List[TaskListener] = []
+
+def add_task_listener(listener: TaskListener) -> None:
+    """Register a callback to be notified of task writes"""
+    if listener not in _task_listeners:
+        _task_listeners.append(listener)
+
+def remove_task_listener(listener: TaskListener) -> None:
+    """Unregister a previously added task listener"""
+    if listener in _task_listeners:
+        _task_listeners.remove(listener)
+
+def _notify_task_listeners(event: str, task_id: str, data: Dict[str, Any]) -> None:
+    """Notify listeners of a task write; listener errors never fail the write"""
+    for listener in list(_task_listeners):
+        try:
+            listener(event, task_id, data)
+        except Exception as e:
+            logger.error(f"Task listener failed on {event} of task {task_id}: {e}")
+
 def get_tasks(filters: Optional[Dict[str, Any]] = None, sort_by: str = "date", sort_order: int = ASCENDING) -> List[Dict[str, Any]]:
     """Get tasks with optional filtering and sorting"""
     try:
@@ -74,7 +99,9 @@ def create_task(task_data: Dict[str, Any]) -> Optional[str]:
         
         result = tasks_collection.insert_one(task_data)
         logger.info(f"Task created with ID: {result.inserted_id}")
-        return str(result.inserted_id)
+        task_id = str(result.inserted_id)
+        _notify_task_listeners("create", task_id, {k: v for k, v in task_data.items() if k != '_id'})
+        return task_id
     except Exception as e:
         logger.error(f"Error creating task: {e}")
         return None
@@ -94,6 +121,7 @@ def update_task(task_id: str, update_data: Dict[str, Any]) -> bool:
         
         if result.modified_count > 0:
             logger.info(f"Task {task_id} updated successfully")
+            _notify_task_listeners("update", task_id, dict(update_data))
             return True
         else:
             logger.warning(f"No changes made to task {task_id}")
@@ -112,6 +140,7 @@ def delete_task(task_id: str) -> bool:
         
         if result.deleted_count > 0:
             logger.info(f"Task {task_id} deleted successfully")
+            _notify_task_listeners("delete", task_id, {})
             return True
         else:
             logger.warning(f"Task {task_id} not found for deletion")
@@ -121,6 +150,51 @@ def delete_task(task_id: str) -> bool:
         logger.error(f"Error deleting task {task_id}: {e}")
         return False
 
+# Task fields handed to reminder sinks, shared by the look-ahead query and the scheduler
+REMINDER_TASK_FIELDS = ("title", "date", "priority", "status", "description", "tags", "completed")
+# Statuses that end a task even when its completed flag was never set
+CLOSED_STATUSES = ("completed", "cancelled")
+
+def get_upcoming_tasks(start_date: str, end_date: str) -> Optional[List[Dict[str, Any]]]:
+    """Get open, not yet reminded tasks due between two YYYY-MM-DD dates (inclusive), or None if the query fails"""
+    try:
+        cursor = tasks_collection.find(
+            {
+                # OCR-extracted tasks may lack the field entirely; null also matches missing
+                "completed": {"$in": [False, None]},
+                "date": {"$gte": start_date, "$lte": end_date},
+                "status": {"$nin": list(CLOSED_STATUSES)},
+                # Skip tasks already reminded for their current due date
+                "$expr": {"$ne": ["$reminded_for", "$date"]}
+            },
+            {field: 1 for field in REMINDER_TASK_FIELDS}
+        ).sort("date", ASCENDING)
+        tasks = list(cursor)
+        
+        # Convert ObjectId to string
+        for task in tasks:
+            task['_id'] = str(task['_id'])
+        
+        return tasks
+    except Exception as e:
+        logger.error(f"Error fetching upcoming tasks: {e}")
+        return None
+
+def mark_task_reminded(task_id: str, due_date: str) -> bool:
+    """Record that a task's reminder for a due date was sent; False if it already was or the write failed"""
+    try:
+        from bson.objectid import ObjectId
+        
+        # Conditional update, so only one caller ever claims a given reminder
+        result = tasks_collection.update_one(
+            {"_id": ObjectId(task_id), "date": due_date, "reminded_for": {"$ne": due_date}},
+            {"$set": {"reminded_for": due_date}}
+        )
+        return result.modified_count > 0
+    except Exception as e:
+        logger.error(f"Error marking task {task_id} reminded: {e}")
+        return False
+
 def get_task_statistics() -> Dict[str, Any]:
     """Get task statistics for dashboard"""
     try:
@@ -1,5 +1,7 @@
 import os
 import pickle
+import tempfile
+import threading
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 
@@ -8,18 +10,49 @@ SCOPES = [
     'https://www.googleapis.com/auth/tasks'
 ]
 
-def get_credentials():
-    creds = None
-    if os.path.exists('token.json'):
-        with open('token.json', 'rb') as token:
-            creds = pickle.load(token)
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            flow = InstalledAppFlow.from_client_secrets_file(
-                'credentials.json', SCOPES)
-            creds = flow.run_local_server(port=0)
-        with open('token.json', 'wb') as token:
+TOKEN_FILE = 'token.json'
+
+# Serialises reading, refreshing and rewriting the token file across threads
+_token_lock = threading.Lock()
+
+def _save_credentials(creds):
+    # Write to a temp file and swap it in, so readers never see a partial token
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(TOKEN_FILE)))
+    try:
+        with os.fdopen(fd, 'wb') as token:
             pickle.dump(creds, token)
+        os.replace(tmp_path, TOKEN_FILE)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+def get_stored_credentials():
+    """Load saved credentials, refreshing them if needed, without starting an OAuth flow"""
+    with _token_lock:
+        if not os.path.exists(TOKEN_FILE):
+            return None
+        try:
+            with open(TOKEN_FILE, 'rb') as token:
+                creds = pickle.load(token)
+        except Exception:
+            return None
+        if creds and creds.valid:
+            return creds
+        if creds and creds.expired and creds.refresh_token:
+            try:
+                creds.refresh(Request())
+            except Exception:
+                return None
+            _save_credentials(creds)
+            return creds
+        return None
+
+def get_credentials():
+    creds = get_stored_credentials()
+    if not creds:
+        flow = InstalledAppFlow.from_client_secrets_file(
+            'credentials.json', SCOPES)
+        creds = flow.run_local_server(port=0)
+        with _token_lock:
+            _save_credentials(creds)
     return creds
@@ -5,6 +5,7 @@ from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
 import logging
 from typing import List, Optional
+from contextlib import asynccontextmanager
 import json
 
 from app.ocr import extract_tasks_from_image
@@ -16,12 +17,24 @@ from app.google_auth import get_credentials
 from app.google_calendar import add_event_to_calendar
 from app.google_tasks import add_task_to_google_tasks
 from app.models import Task, TaskUpdate
+from app.reminders import ReminderScheduler, build_reminder_sink
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Enhanced Task Manager", version="2.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the due-date reminder scheduler for the lifetime of the app"""
+    scheduler = ReminderScheduler(build_reminder_sink())
+    scheduler.start()
+    app.state.reminder_scheduler = scheduler
+    try:
+        yield
+    finally:
+        await scheduler.stop()
+
+app = FastAPI(title="Enhanced Task Manager", version="2.0.0", lifespan=lifespan)
 
 # Add CORS middleware
 app.add_middleware(
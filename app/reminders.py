@@ -0,0 +1,309 @@
+import asyncio
+import heapq
+import itertools
+import json
+import logging
+import os
+import urllib.request
+from abc import ABC, abstractmethod
+from datetime import datetime, date, time, timedelta
+from typing import List, Dict, Any, Optional, Tuple
+
+from app.database import (
+    REMINDER_TASK_FIELDS, CLOSED_STATUSES, get_task_by_id, get_upcoming_tasks,
+    mark_task_reminded, add_task_listener, remove_task_listener
+)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Reminder configuration
+REMINDER_SINK = os.getenv("REMINDER_SINK", "log")  # log, webhook, google_tasks
+REMINDER_WEBHOOK_URL = os.getenv("REMINDER_WEBHOOK_URL", "")
+REMINDER_LOOKAHEAD_HOURS = float(os.getenv("REMINDER_LOOKAHEAD_HOURS", "24"))
+# Time of day a task's reminder fires on its due date (matches Google Calendar events)
+REMINDER_TIME = time(9, 0)
+# Delay before retrying a failed look-ahead load
+REMINDER_RETRY_SECONDS = 30
+# Shortest look-ahead window; shorter ones would reload the window back to back
+MIN_REMINDER_LOOKAHEAD = timedelta(hours=1)
+
+
+class ReminderSink(ABC):
+    """Destination for fired reminders"""
+
+    @abstractmethod
+    def send(self, task: Dict[str, Any]) -> None:
+        """Deliver a reminder for a due task"""
+
+
+class LogReminderSink(ReminderSink):
+    """Write reminders to the application log"""
+
+    def send(self, task: Dict[str, Any]) -> None:
+        logger.info(f"Reminder: task '{task.get('title')}' ({task.get('_id')}) is due {task.get('date')}")
+
+
+class WebhookReminderSink(ReminderSink):
+    """POST reminders as JSON to a webhook URL"""
+
+    def __init__(self, url: str, timeout: float = 10.0):
+        self.url = url
+        self.timeout = timeout
+
+    def send(self, task: Dict[str, Any]) -> None:
+        payload = json.dumps({"event": "task_due", "task": task}, default=str).encode("utf-8")
+        request = urllib.request.Request(
+            self.url, data=payload, headers={"Content-Type": "application/json"}, method="POST"
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+
+class GoogleTasksReminderSink(ReminderSink):
+    """Push reminders into the default Google Tasks list"""
+
+    def send(self, task: Dict[str, Any]) -> None:
+        from app.google_auth import get_stored_credentials
+        from app.google_tasks import add_task_to_google_tasks
+
+        # Never start the interactive OAuth flow from a background worker
+        creds = get_stored_credentials()
+        if not creds:
+            logger.warning(f"No stored Google credentials, skipping reminder for task {task.get('_id')}")
+            return
+        add_task_to_google_tasks(f"Reminder: {task['title']}", task['date'], creds)
+
+
+def build_reminder_sink(kind: str = REMINDER_SINK) -> ReminderSink:
+    """Create the reminder sink selected by configuration"""
+    if kind == "webhook":
+        if not REMINDER_WEBHOOK_URL:
+            logger.warning("REMINDER_WEBHOOK_URL not set, falling back to log reminders")
+            return LogReminderSink()
+        return WebhookReminderSink(REMINDER_WEBHOOK_URL)
+    if kind == "google_tasks":
+        return GoogleTasksReminderSink()
+    if kind != "log":
+        logger.warning(f"Unknown REMINDER_SINK '{kind}', falling back to log reminders")
+    return LogReminderSink()
+
+
+def reminder_time_for(task: Dict[str, Any]) -> Optional[datetime]:
+    """Get the moment a task's reminder should fire, or None if it has no valid date"""
+    try:
+        return datetime.combine(date.fromisoformat(task["date"]), REMINDER_TIME)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def reminder_payload(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a task to the fields handed to reminder sinks"""
+    payload = {field: task[field] for field in REMINDER_TASK_FIELDS if field in task}
+    payload['_id'] = str(task['_id'])
+    return payload
+
+
+class ReminderScheduler:
+    """
+    Fire reminders for pending tasks when they fall due.
+
+    Only tasks due inside a bounded look-ahead window are held in memory, in a
+    min-heap keyed on fire time. The run loop sleeps until the earliest reminder
+    or the end of the window, whichever comes first, and is woken early only when
+    a task write puts a new reminder at the head of the heap. Task writes reach
+    the scheduler through the database task listeners.
+
+    A pending task due today whose reminder time has already passed fires
+    immediately, and a failed load is retried without moving the window on.
+    Each reminder is claimed on the task document (reminded_for) before it is
+    sent, so restarts and overlapping windows never send it twice.
+    """
+
+    def __init__(self, sink: ReminderSink, lookahead: timedelta = timedelta(hours=REMINDER_LOOKAHEAD_HOURS)):
+        self.sink = sink
+        if lookahead < MIN_REMINDER_LOOKAHEAD:
+            logger.warning(f"Reminder look-ahead {lookahead} too short, using {MIN_REMINDER_LOOKAHEAD}")
+            lookahead = MIN_REMINDER_LOOKAHEAD
+        self.lookahead = lookahead
+        # Heap of (fire_at, seq, task_id); entries not matching _entries are stale
+        self._heap: List[Tuple[datetime, int, str]] = []
+        self._entries: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._counter = itertools.count()
+        self._window_end: Optional[datetime] = None
+        # Earliest due date still reminded; tasks due before it are never caught up
+        self._earliest_due: Optional[date] = None
+        # task_id -> token of the newest in-flight reload; older reloads are ignored
+        self._reloads: Dict[str, int] = {}
+        # Task states that arrive while a window is loading, applied once it is in place
+        self._deferred: Optional[List[Tuple[str, Optional[Dict[str, Any]]]]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._runner: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the scheduler on the running event loop"""
+        if self._runner:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        add_task_listener(self._on_task_event)
+        self._runner = self._loop.create_task(self._run())
+        logger.info("Reminder scheduler started")
+
+    async def stop(self) -> None:
+        """Stop the scheduler and detach from task writes"""
+        remove_task_listener(self._on_task_event)
+        if self._runner:
+            self._runner.cancel()
+            try:
+                await self._runner
+            except asyncio.CancelledError:
+                pass
+            self._runner = None
+        logger.info("Reminder scheduler stopped")
+
+    def pending(self) -> int:
+        """Number of reminders currently scheduled"""
+        return len(self._entries)
+
+    def schedule(self, task: Dict[str, Any]) -> None:
+        """Schedule, reschedule or drop a task's reminder based on its current state"""
+        task_id = str(task['_id'])
+        fire_at = reminder_time_for(task)
+        if (task.get('completed') or task.get('status') in CLOSED_STATUSES
+                or fire_at is None or self._window_end is None
+                or fire_at.date() < self._earliest_due or fire_at >= self._window_end
+                or task.get('reminded_for') == task['date']):
+            self.unschedule(task_id)
+            return
+
+        seq = next(self._counter)
+        self._entries[task_id] = (seq, reminder_payload(task))
+        heapq.heappush(self._heap, (fire_at, seq, task_id))
+        if self._heap[0][1] == seq:
+            self._wakeup.set()
+
+    def unschedule(self, task_id: str) -> None:
+        """Drop a task's reminder; its heap entry is discarded lazily when popped"""
+        self._entries.pop(task_id, None)
+
+    def _on_task_event(self, event: str, task_id: str, data: Dict[str, Any]) -> None:
+        """Task listener; hands the write over to the event loop thread"""
+        if self._loop and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._apply_task_event, event, task_id, data)
+
+    def _apply_task_event(self, event: str, task_id: str, data: Dict[str, Any]) -> None:
+        # Any newer write supersedes a reload still in flight for the task
+        self._reloads.pop(task_id, None)
+        if event == "delete" or data.get("completed"):
+            self._apply_task_state(task_id, None)
+        elif event == "create":
+            self._apply_task_state(task_id, {**data, "_id": task_id})
+        elif event == "update":
+            if "date" not in data and "completed" not in data and task_id not in self._entries:
+                return
+            # Updates are partial, so reload the task to see its full state
+            token = next(self._counter)
+            self._reloads[task_id] = token
+            self._loop.create_task(self._reload_task(task_id, token))
+
+    async def _reload_task(self, task_id: str, token: int) -> None:
+        task = await self._loop.run_in_executor(None, get_task_by_id, task_id)
+        if self._reloads.get(task_id) != token:
+            return
+        del self._reloads[task_id]
+        self._apply_task_state(task_id, task)
+
+    def _apply_task_state(self, task_id: str, task: Optional[Dict[str, Any]]) -> None:
+        if self._deferred is not None:
+            self._deferred.append((task_id, task))
+        elif task:
+            self.schedule(task)
+        else:
+            self.unschedule(task_id)
+
+    async def _refill(self, now: datetime) -> bool:
+        """Load the next look-ahead window with an indexed range query; False if the load failed"""
+        # Catch up from where the last loaded window ended, in case loads failed past midnight
+        start = min(self._window_end, now).date() if self._window_end else now.date()
+        end = now + self.lookahead
+        self._deferred = []
+        try:
+            tasks = await self._loop.run_in_executor(
+                None, get_upcoming_tasks, start.isoformat(), end.date().isoformat()
+            )
+        finally:
+            deferred, self._deferred = self._deferred, None
+
+        if tasks is None:
+            logger.warning(f"Failed to load reminder window, retrying in {REMINDER_RETRY_SECONDS}s")
+        else:
+            self._heap = []
+            self._entries = {}
+            self._window_end = end
+            self._earliest_due = start
+            for task in tasks:
+                self.schedule(task)
+            logger.info(f"Reminder window loaded until {end.isoformat()}: {self.pending()} reminders")
+
+        # Writes made during the load are newer than the query results. After a
+        # failed load they still apply to the window that stays in place.
+        for task_id, task in deferred:
+            self._apply_task_state(task_id, task)
+        return tasks is not None
+
+    def _pop_due(self, now: datetime) -> List[Dict[str, Any]]:
+        """Pop every live reminder due at or before now"""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            _, seq, task_id = heapq.heappop(self._heap)
+            entry = self._entries.get(task_id)
+            if entry and entry[0] == seq:
+                del self._entries[task_id]
+                due.append(entry[1])
+        return due
+
+    def _discard_stale_head(self) -> None:
+        """Pop cancelled or superseded entries so the heap head is a live reminder"""
+        while self._heap:
+            _, seq, task_id = self._heap[0]
+            entry = self._entries.get(task_id)
+            if entry and entry[0] == seq:
+                return
+            heapq.heappop(self._heap)
+
+    def _deliver(self, task: Dict[str, Any]) -> None:
+        # Claim before sending: a failed send is not retried, but nothing is sent twice
+        if not mark_task_reminded(task['_id'], task['date']):
+            return
+        try:
+            self.sink.send(task)
+        except Exception as e:
+            logger.error(f"Error delivering reminder for task {task.get('_id')}: {e}")
+
+    async def _run(self) -> None:
+        while True:
+            now = datetime.now()
+            if self._window_end is None or now >= self._window_end:
+                if not await self._refill(now):
+                    # The window is left where it was, so nothing due since is skipped
+                    await asyncio.sleep(REMINDER_RETRY_SECONDS)
+                    continue
+                now = datetime.now()
+
+            # Sinks may block on network I/O, so deliver off the event loop
+            for task in self._pop_due(now):
+                self._loop.run_in_executor(None, self._deliver, task)
+
+            deadline = self._window_end
+            self._discard_stale_head()
+            if self._heap:
+                deadline = min(deadline, self._heap[0][0])
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max((deadline - now).total_seconds(), 0))
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,57 @@
+import os
+import sys
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The scheduler talks to MongoDB only through app.database, so tests swap in an
+# in-memory stand-in before app.reminders is imported
+fake_database = types.ModuleType("app.database")
+fake_database.REMINDER_TASK_FIELDS = ("title", "date", "priority", "status", "description", "tags", "completed")
+fake_database.CLOSED_STATUSES = ("completed", "cancelled")
+
+
+class FakeTaskStore:
+    def __init__(self):
+        self.tasks = {}
+        self.listeners = []
+        self.fail_upcoming = False
+
+    def get_task_by_id(self, task_id):
+        task = self.tasks.get(task_id)
+        return dict(task) if task else None
+
+    def get_upcoming_tasks(self, start_date, end_date):
+        if self.fail_upcoming:
+            return None
+        return [
+            dict(task) for task in sorted(self.tasks.values(), key=lambda t: t["date"])
+            if start_date <= task["date"] <= end_date
+            and not task.get("completed")
+            and task.get("status") not in fake_database.CLOSED_STATUSES
+            and task.get("reminded_for") != task["date"]
+        ]
+
+    def mark_task_reminded(self, task_id, due_date):
+        task = self.tasks.get(task_id)
+        if not task or task["date"] != due_date or task.get("reminded_for") == due_date:
+            return False
+        task["reminded_for"] = due_date
+        return True
+
+
+store = FakeTaskStore()
+fake_database.get_task_by_id = lambda task_id: store.get_task_by_id(task_id)
+fake_database.get_upcoming_tasks = lambda start, end: store.get_upcoming_tasks(start, end)
+fake_database.mark_task_reminded = lambda task_id, due: store.mark_task_reminded(task_id, due)
+fake_database.add_task_listener = lambda listener: store.listeners.append(listener)
+fake_database.remove_task_listener = lambda listener: store.listeners.remove(listener)
+sys.modules["app.database"] = fake_database
+
+
+@pytest.fixture
+def db():
+    store.__init__()
+    return store
@@ -0,0 +1,251 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import reminders
+from app.reminders import ReminderScheduler, ReminderSink, build_reminder_sink
+
+DAY1 = datetime(2026, 10, 19)
+DAY2 = DAY1 + timedelta(days=1)
+
+
+class FakeClock(datetime):
+    current = DAY1
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.current
+
+
+class RecordingSink(ReminderSink):
+    def __init__(self):
+        self.sent = []
+
+    def send(self, task):
+        self.sent.append(task)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    monkeypatch.setattr(reminders, "datetime", FakeClock)
+    return FakeClock
+
+
+@pytest.fixture
+def sink():
+    return RecordingSink()
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def attach(scheduler):
+    """Bind a scheduler to the running loop without starting its run loop"""
+    scheduler._loop = asyncio.get_running_loop()
+    scheduler._wakeup = asyncio.Event()
+
+
+async def settle():
+    """Wait for reloads spawned by task events to finish"""
+    others = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+    await asyncio.gather(*others)
+
+
+def add_task(db, task_id, due, **fields):
+    db.tasks[task_id] = {"_id": task_id, "title": task_id.upper(), "date": due.date().isoformat(), **fields}
+
+
+def fire(scheduler, now):
+    """Pop due reminders and deliver them inline"""
+    due = scheduler._pop_due(now)
+    for task in due:
+        scheduler._deliver(task)
+    return [task["_id"] for task in due]
+
+
+def test_startup_after_reminder_time_catches_up(db, clock, sink):
+    add_task(db, "a", DAY1)
+    clock.current = DAY1.replace(hour=10)
+
+    async def scenario():
+        scheduler = ReminderScheduler(sink, timedelta(hours=24))
+        attach(scheduler)
+        assert await scheduler._refill(clock.current)
+        assert scheduler.pending() == 1
+        assert fire(scheduler, clock.current) == ["a"]
+
+    run(scenario())
+    assert [task["_id"] for task in sink.sent] == ["a"]
+
+
+def test_create_after_reminder_time_fires_immediately(db, clock, sink):
+    clock.current = DAY1.replace(hour=10)
+
+    async def scenario():
+        scheduler = ReminderScheduler(sink, timedelta(hours=24))
+        attach(scheduler)
+        await scheduler._refill(clock.current)
+        add_task(db, "b", DAY1, status="pending", created_at="x")
+        scheduler._apply_task_event("create", "b", {k: v for k, v in db.tasks["b"].items() if k != "_id"})
+        assert fire(scheduler, clock.current) == ["b"]
+
+    run(scenario())
+    # Created tasks reach sinks with the same projected fields as loaded ones
+    assert sink.sent == [{"_id": "b", "title": "B", "date": "2026-10-19", "status": "pending"}]
+
+
+def test_title_only_edit_does_not_refire(db, clock, sink):
+    add_task(db, "a", DAY1)
+    clock.current = DAY1.replace(hour=10)
+
+    async def scenario():
+        scheduler = ReminderScheduler(sink, timedelta(hours=24))
+        attach(scheduler)
+        await scheduler._refill(clock.current)
+        assert fire(scheduler, clock.current) == ["a"]
+
+        db.tasks["a"]["title"] = "Renamed"
+        scheduler._apply_task_event("update", "a", {"title": "Renamed"})
+        assert not scheduler._reloads
+        # The edit form always resends the unchanged date
+        scheduler._apply_task_event("update", "a", {"title": "Renamed", "date": "2026-10-19"})
+        await settle()
+        assert scheduler.pending() == 0
+
+    run(scenario())
+    assert len(sink.sent) == 1
+
+
+def test_restart_does_not_resend(db, clock, sink):
+    add_task(db, "a", DAY1)
+    clock.current = DAY1.replace(hour=10)
+
+    async def scenario():
+        for _ in range(2):
+            scheduler = ReminderScheduler(sink, timedelta(hours=24))
+            attach(scheduler)
+            await scheduler._refill(clock.current)
+            fire(scheduler, clock.current)
+
+    run(scenario())
+    assert len(sink.sent) == 1
+
+
+@pytest.mark.parametrize("event, data", [
+    ("update", {"completed": True}),
+    ("delete", {}),
+])
+def test_complete_or_delete_unschedules(db, clock, sink, event, data):
+    add_task(db, "a", DAY1)
+    clock.current = DAY1.replace(hour=8)
+
+    async def scenario():
+        scheduler = ReminderScheduler(sink, timedelta(hours=24))
+        attach(scheduler)
+        await scheduler._refill(clock.current)
+        assert scheduler.pending() == 1
+        scheduler._apply_task_event(event, "a", data)
+        assert scheduler.pending() == 0
+        assert fire(scheduler, DAY1.replace(hour=9)) == []
+
+    run(scenario())
+
+
+def test_cancelled_status_unschedules(db, clock, sink):
+    add_task(db, "a", DAY1)
+    clock.current = DAY1.replace(hour=8)
+
+    async def scenario():
+        scheduler = ReminderScheduler(sink, timedelta(hours=24))
+        attach(scheduler)
+        await scheduler._refill(clock.current)
+        db.tasks["a"]["status"] = "cancelled"
+        scheduler._apply_task_event("update", "a", {"status": "cancelled", "date": "2026-10-19"})
+        await settle()
+        assert scheduler.pending() == 0
+
+    run(scenario())
+
+
+def test_failed_load_keeps_window_and_retries(db, clock, sink, monkeypatch):
+    monkeypatch.setattr(reminders, "REMINDER_RETRY_SECONDS", 0.01)
+    add_task(db, "a", DAY1)
+    clock.current = DAY1.replace(hour=10)
+    db.fail_upcoming = True
+
+    async def scenario():
+        scheduler = ReminderScheduler(sink, timedelta(hours=24))
+        scheduler.start()
+        await asyncio.sleep(0.05)
+        assert scheduler._window_end is None
+        db.fail_upcoming = False
+        await asyncio.sleep(0.05)
+        assert scheduler._window_end == clock.current + timedelta(hours=24)
+        await scheduler.stop()
+
+    run(scenario())
+    assert [task["_id"] for task in sink.sent] == ["a"]
+
+
+def test_writes_during_failed_load_are_applied(db, clock, sink, monkeypatch):
+    add_task(db, "a", DAY1)
+    clock.current = DAY1.replace(hour=8)
+
+    async def scenario():
+        scheduler = ReminderScheduler(sink, timedelta(hours=24))
+        attach(scheduler)
+        await scheduler._refill(clock.current)
+        assert scheduler.pending() == 1
+
+        def failing_load(start, end):
+            # A delete lands on the loop while the query is in flight
+            scheduler._loop.call_soon_threadsafe(scheduler._apply_task_event, "delete", "a", {})
+            return None
+
+        monkeypatch.setattr(reminders, "get_upcoming_tasks", failing_load)
+        assert not await scheduler._refill(clock.current)
+        assert scheduler.pending() == 0
+
+    run(scenario())
+
+
+def test_rollover_loads_next_window(db, clock, sink):
+    add_task(db, "a", DAY1)
+    add_task(db, "b", DAY2)
+    clock.current = DAY1.replace(hour=8)
+
+    async def scenario():
+        scheduler = ReminderScheduler(sink, timedelta(hours=24))
+        attach(scheduler)
+        await scheduler._refill(clock.current)
+        assert scheduler.pending() == 1
+        assert fire(scheduler, DAY1.replace(hour=9)) == ["a"]
+
+        clock.current = DAY2.replace(hour=8)
+        assert await scheduler._refill(clock.current)
+        assert list(scheduler._entries) == ["b"]
+        assert fire(scheduler, DAY2.replace(hour=9)) == ["b"]
+
+    run(scenario())
+    assert [task["_id"] for task in sink.sent] == ["a", "b"]
+
+
+def test_short_lookahead_is_clamped(sink):
+    assert ReminderScheduler(sink, timedelta(0)).lookahead == reminders.MIN_REMINDER_LOOKAHEAD
+
+
+def test_unknown_sink_warns(caplog):
+    with caplog.at_level(logging.WARNING, logger="app.reminders"):
+        assert isinstance(build_reminder_sink("webhok"), reminders.LogReminderSink)
+    assert "webhok" in caplog.text
+
+
+def test_sink_without_send_fails_on_creation():
+    class Incomplete(ReminderSink):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()